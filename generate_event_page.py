@@ -7,14 +7,16 @@ This script:
 3) Builds an index.html linking all generated event pages
 """
 
-from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import csv
 from datetime import datetime, timezone
-import html
+import functools
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
 import re
 from string import Template
-from typing import Optional
+from typing import Iterable, Optional
 
 
 CSV_FILE = Path("data/EC2026.csv")
@@ -23,12 +25,71 @@ LEGACY_FALLBACK_CSV_FILE = Path("WrestleGame_db - Sheet1.csv")
 TEMPLATE_FILE = Path("template.html")
 INDEX_FILE = Path("index.html")
 LEGACY_EVENT_FILE = Path("event.html")
+DATA_DIR = Path("data")
+LOGO_DIR = Path("assets/logos")
+CSV_BUFFER_SIZE = 1 << 20
+OUTPUT_BUFFER_SIZE = 1 << 20
+WRITE_WORKERS = 4
 BELT_DEFAULT_IMAGE = "assets/belts/default.png"
 BELT_IMAGE_BY_MATCH = {
     "World Heavyweight Championship": "assets/belts/world_heavyweight.png",
     "Women's Intercontinental Championship": "assets/belts/womens_ic.png",
     "Women's Intercontinental Champion": "assets/belts/womens_ic.png",
 }
+# Text chunks and (chunk index, placeholder name) slots, as returned by split_template.
+SplitTemplate = tuple[list[str], list[tuple[int, str]]]
+CHAMPION_VALUES = frozenset({"y", "yes", "true", "1"})
+# Month and day use strptime's %m/%d digit classes (ASCII apart from the
+# day's second digit); years use \d, like %Y and %y.
+EVENT_DATE_PATTERN = re.compile(
+    r"(1[0-2]|0[1-9]|[1-9])/(3[01]|[12]\d|0[1-9]|[1-9]| [1-9])/(\d{4}|\d{2})"
+    r"|(\d{4})-(1[0-2]|0[1-9]|[1-9])-(3[01]|[12]\d|0[1-9]|[1-9]| [1-9])"
+)
+UNSAFE_EVENT_ID_CHARS = re.compile(r"[^A-Za-z0-9_-]")
+# ASCII-only fast path for UNSAFE_EVENT_ID_CHARS: every other ASCII character becomes "_".
+EVENT_ID_SANITIZE_TABLE = str.maketrans({
+    chr(code): "_" for code in range(128) if UNSAFE_EVENT_ID_CHARS.match(chr(code))
+})
+# Wrestler card and leaderboard row markup. Each is filled with %-formatting
+# so a card or row is a single C-level format call.
+PICK_CARD_HTML = (
+    '    <div class="%s" data-match="%s" data-odds="%s" data-result="%s">\n'
+    '      <div class="wrestler-main">\n'
+    '        <span class="name">%s%s%s</span>\n'
+    '      </div>\n'
+    '      <div class="odds">Odds: %s</div>\n'
+    '      <div class="wager-row">\n'
+    '        <label class="wager-label">Wager (pts)</label>\n'
+    '        <input class="wager-input" type="number" min="0" step="1" value="0" placeholder="%s"%s>\n'
+    '      </div>\n'
+    '    </div>\n'
+)
+LIVE_CARD_HTML = (
+    '    <div class="%s">\n'
+    '      <div class="wrestler-main">\n'
+    '        <span class="name">%s%s%s</span>\n'
+    '      </div>\n'
+    '      <div class="odds">Odds: %s</div>\n'
+    '    </div>\n'
+)
+LEADERBOARD_ROW_HTML = (
+    '<tr class="%s">\n'
+    '  <td>%s</td>\n'
+    '  <td class="score-cell">%d</td>\n'
+    '  <td class="stat-cell">%d-%d</td>\n'
+    '  <td class="num-cell">%d</td>\n'
+    '  <td class="num-cell">%d</td>\n'
+    '  <td class="num-cell">%d</td>\n'
+    '</tr>\n'
+)
+# Same replacements as html.escape(quote=True), applied in a single pass.
+HTML_ESCAPE_TABLE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&#x27;",
+})
 
 
 def normalize(value: str) -> str:
@@ -36,57 +97,95 @@ def normalize(value: str) -> str:
     return (value or "").strip().lower()
 
 
-def pick_first_key(row: dict, possible_keys: list[str]) -> str:
+def escape_html(value: str) -> str:
+    """Escape text for HTML output; empty and alphanumeric values are returned as-is."""
+    if not value or value.isalnum():
+        return value
+    return value.translate(HTML_ESCAPE_TABLE)
+
+
+def pick_first_key(header: list[str], possible_keys: list[str]) -> str:
     """
-    Return the first matching key name from possible_keys that exists in row.
+    Return the first matching key name from possible_keys that exists in header.
     Returns an empty string if none are found.
     """
     for key in possible_keys:
-        if key in row:
+        if key in header:
             return key
     return ""
 
 
-def load_rows(csv_path: Path) -> list[dict]:
-    """Read all rows from a CSV file and return them as a list of dictionaries."""
-    with csv_path.open("r", newline="", encoding="utf-8-sig") as f:
-        reader = csv.DictReader(f)
-        return list(reader)
-
-
-def get_available_event_ids(rows: list[dict], event_id_key: str) -> list[str]:
-    """Collect unique EventIDs in the order they first appear."""
-    seen = OrderedDict()
-    for row in rows:
-        event_id = (row.get(event_id_key) or "").strip()
-        if event_id:
-            seen[event_id] = True
-    return list(seen.keys())
+def load_rows(csv_path: Path) -> tuple[list[str], list[list[str]]]:
+    """
+    Read a CSV file in one pass and return its header and data rows as lists.
+    Blank lines are skipped and short rows are padded with empty strings to
+    the header width, so columns can be read by index.
+    """
+    with csv_path.open("r", buffering=CSV_BUFFER_SIZE, newline="", encoding="utf-8-sig") as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        width = len(header)
+        rows = []
+        for row in reader:
+            if not row:
+                continue
+            if len(row) < width:
+                row.extend([""] * (width - len(row)))
+            rows.append(row)
+    return header, rows
+
+
+def collect_event_rows(rows: Iterable[list[str]], event_id_col: int) -> dict[str, list[list[str]]]:
+    """
+    Group rows by EventID in a single pass.
+    Returns each unique EventID, in the order it first appears, mapped to its
+    rows; EventIDs that differ only in case or spacing share the same rows.
+    """
+    seen: dict[str, str] = {}
+    normalized_ids = {}
+    event_rows_by_id = {}
+    # Rows for one event are usually contiguous, so walk runs of equal EventID
+    # values and do the bucket bookkeeping once per run rather than per row.
+    for raw_event_id, run in groupby(rows, key=itemgetter(event_id_col)):
+        # Most runs repeat an EventID already seen, so normalize each raw value once.
+        normalized_id = normalized_ids.get(raw_event_id)
+        if normalized_id is None:
+            normalized_id = normalize(raw_event_id)
+            normalized_ids[raw_event_id] = normalized_id
+            event_id = raw_event_id.strip()
+            if event_id:
+                seen.setdefault(event_id, normalized_id)
+        event_rows_by_id.setdefault(normalized_id, []).extend(run)
+    return {event_id: event_rows_by_id[normalized_id] for event_id, normalized_id in seen.items()}
 
 
 def is_current_champion(value: str) -> bool:
     """Interpret several common yes/true values as champion markers."""
-    return normalize(value) in {"y", "yes", "true", "1"}
+    return bool(value) and value.strip().lower() in CHAMPION_VALUES
 
 
+@functools.lru_cache(maxsize=None)
 def parse_american_odds(odds_text: str) -> Optional[int]:
     """Convert odds text to an integer (e.g., '150', '+150', '-200') or None."""
     cleaned = (odds_text or "").strip()
-    if not cleaned:
+    digits = cleaned[1:] if cleaned[:1] in ("+", "-") else cleaned
+    if digits.isdecimal():
+        return int(cleaned)
+    if "_" not in digits:
         return None
+    # int() also allows underscores between digits (e.g. '1_000').
     try:
         return int(cleaned)
     except ValueError:
         return None
 
 
-def format_odds(odds_text: str) -> str:
+def format_odds(odds_value: Optional[int]) -> str:
     """
-    Return display-friendly odds text.
+    Return display-friendly odds text for odds already parsed by parse_american_odds.
     - Positive odds are shown with a '+' sign (150 -> +150)
     - Missing/invalid odds are shown as TBD
     """
-    odds_value = parse_american_odds(odds_text)
     if odds_value is None:
         return "TBD"
 
@@ -95,6 +194,7 @@ def format_odds(odds_text: str) -> str:
     return str(odds_value)
 
 
+@functools.lru_cache(maxsize=None)
 def format_start_time(time_text: str) -> str:
     """
     Convert HH:MM (24-hour) to h:mmam/pm EST.
@@ -130,6 +230,31 @@ def day_ordinal(day: int) -> str:
     return f"{day}{suffix}"
 
 
+@functools.lru_cache(maxsize=None)
+def parse_event_date(raw: str) -> Optional[datetime]:
+    """
+    Parse M/D/YYYY, M/D/YY or YYYY-MM-DD with one regex match.
+    Like strptime's %d, the day may also be a space-padded single digit.
+    Returns None for anything else, including impossible dates.
+    """
+    found = EVENT_DATE_PATTERN.fullmatch(raw)
+    if not found:
+        return None
+
+    month, day, year, iso_year, iso_month, iso_day = found.groups()
+    if iso_year:
+        year, month, day = iso_year, iso_month, iso_day
+    elif len(year) == 2:
+        # Same pivot as strptime's %y: 00-68 -> 2000s, 69-99 -> 1900s.
+        short_year = int(year)
+        year = short_year + (2000 if short_year <= 68 else 1900)
+    try:
+        return datetime(int(year), int(month), int(day))
+    except ValueError:
+        return None
+
+
+@functools.lru_cache(maxsize=None)
 def format_event_date(date_text: str) -> str:
     """
     Convert date values like 2/28/2026 into:
@@ -139,14 +264,7 @@ def format_event_date(date_text: str) -> str:
     if not raw:
         return "Unknown Date"
 
-    parsed = None
-    for fmt in ("%m/%d/%Y", "%m/%d/%y", "%Y-%m-%d"):
-        try:
-            parsed = datetime.strptime(raw, fmt)
-            break
-        except ValueError:
-            continue
-
+    parsed = parse_event_date(raw)
     if not parsed:
         return raw
 
@@ -161,6 +279,73 @@ def load_template(template_path: Path) -> Template:
         return Template(f.read())
 
 
+def split_template(template: Template) -> SplitTemplate:
+    """
+    Split a Template into text chunks and (chunk index, name) slots.
+    Each slot's chunk holds the original placeholder text, so a render only
+    overwrites the slots it has values for and unknown placeholders stay
+    as-is, like safe_substitute. Escaped ($$) and invalid placeholders are
+    folded into the surrounding literal text.
+    """
+    text = template.template
+    chunks = []
+    slots = []
+    pending = []
+    position = 0
+    for found in template.pattern.finditer(text):
+        pending.append(text[position:found.start()])
+        position = found.end()
+        name = found.group("named") or found.group("braced")
+        if name is None:
+            pending.append(template.delimiter if found.group("escaped") is not None else found.group())
+            continue
+        chunks.append("".join(pending))
+        slots.append((len(chunks), name))
+        chunks.append(found.group())
+        pending = []
+    pending.append(text[position:])
+    chunks.append("".join(pending))
+    return chunks, slots
+
+
+def render_template(compiled: SplitTemplate, values: dict[str, str]) -> str:
+    """Fill a split template; unknown placeholders are kept, like safe_substitute."""
+    chunks, slots = compiled
+    parts = chunks.copy()
+    for index, name in slots:
+        if name in values:
+            parts[index] = values[name]
+    return "".join(parts)
+
+
+@functools.lru_cache(maxsize=None)
+def directory_index(directory: Path, pattern: str, fold_case: bool = False) -> dict[str, Path]:
+    """
+    Map names of files matching pattern in directory to their paths, read once per run.
+    With fold_case, lowercased names are added as well so matching does not
+    depend on the filesystem being case-insensitive.
+    """
+    index = {}
+    if directory.is_dir():
+        for candidate in sorted(directory.glob(pattern)):
+            index[candidate.name] = candidate
+        if fold_case:
+            for name, path in list(index.items()):
+                index.setdefault(name.lower(), path)
+    return index
+
+
+def find_indexed_file(directory: Path, pattern: str, file_name: str, fold_case: bool = False) -> Optional[Path]:
+    """
+    Look up file_name in the cached directory index.
+    With fold_case, its lowercase form is tried against lowercased names too.
+    """
+    index = directory_index(directory, pattern, fold_case)
+    if fold_case:
+        return index.get(file_name) or index.get(file_name.lower())
+    return index.get(file_name)
+
+
 def find_logo_path(event_id: str) -> Optional[str]:
     """
     Find a logo by EventID in assets/logos using:
@@ -172,14 +357,8 @@ def find_logo_path(event_id: str) -> Optional[str]:
     if not cleaned:
         return None
 
-    candidates = [
-        Path("assets/logos") / f"{cleaned}.png",
-        Path("assets/logos") / f"{cleaned.lower()}.png",
-    ]
-    for candidate in candidates:
-        if candidate.exists():
-            return candidate.as_posix()
-    return None
+    logo_path = find_indexed_file(LOGO_DIR, "*.png", f"{cleaned}.png", fold_case=True)
+    return logo_path.as_posix() if logo_path else None
 
 
 def belt_image_for_match(match_name: str) -> str:
@@ -192,9 +371,13 @@ def belt_image_for_match(match_name: str) -> str:
     return BELT_DEFAULT_IMAGE
 
 
+@functools.lru_cache(maxsize=None)
 def sanitize_event_id(event_id: str) -> str:
     """Convert EventID into a file-safe value."""
-    return re.sub(r"[^A-Za-z0-9_-]", "_", (event_id or "").strip())
+    cleaned = (event_id or "").strip()
+    if cleaned.isascii():
+        return cleaned.translate(EVENT_ID_SANITIZE_TABLE)
+    return UNSAFE_EVENT_ID_CHARS.sub("_", cleaned)
 
 
 def event_output_file(event_id: str) -> Path:
@@ -203,127 +386,30 @@ def event_output_file(event_id: str) -> Path:
 
 
 def parse_event_date_for_sort(date_text: str) -> datetime:
-    """Parse event date for index sorting (newest first)."""
-    raw = (date_text or "").strip()
-    for fmt in ("%m/%d/%Y", "%m/%d/%y", "%Y-%m-%d"):
-        try:
-            return datetime.strptime(raw, fmt)
-        except ValueError:
-            continue
-    return datetime.min
-
-
-def build_event_html(event_rows: list[dict], keys: dict[str, str]) -> str:
     """
-    Build a full HTML document for one event.
-    The page includes event details and match sections with wrestler cards.
+    Parse event date for index sorting (newest first).
+    Dates format_event_date leaves as raw text sort last, as datetime.min.
     """
-    first = event_rows[0]
-    raw_event_name = (first.get(keys["event"]) or "Unknown Event").strip()
-    raw_event_id = (first.get(keys["event_id"]) or "").strip()
-    event_name = html.escape(raw_event_name)
-    event_id = html.escape(raw_event_id)
-    event_date = html.escape(format_event_date(first.get(keys["date"]) or ""))
-    start_time = html.escape(format_start_time(first.get(keys["start_time"]) or ""))
-    country = html.escape((first.get(keys["country"]) or "").strip())
-    location = html.escape((first.get(keys["location"]) or "").strip())
-    venue = html.escape((first.get(keys["venue"]) or "").strip())
-    logo_path = find_logo_path(raw_event_id)
-    last_updated = datetime.now(timezone.utc).strftime("%B %d, %Y %H:%M UTC")
-
-    if logo_path:
-        event_header = (
-            f'<img class="event-logo" src="{html.escape(logo_path)}" '
-            f'alt="{html.escape(raw_event_name)} logo">'
-        )
-    else:
-        event_header = f"<h1>{event_name}</h1>"
+    return parse_event_date((date_text or "").strip()) or datetime.min
 
-    # Group rows by match while preserving order.
-    matches = OrderedDict()
-    for row in event_rows:
-        match_name = (row.get(keys["match"]) or "Unknown Match").strip()
-        matches.setdefault(match_name, []).append(row)
-
-    match_sections = []
-    for match_name, rows in matches.items():
-        safe_match_name = html.escape(match_name)
-        wrestler_items = []
-        for row in rows:
-            wrestler_name = html.escape((row.get(keys["wrestler"]) or "Unknown Wrestler").strip())
-            raw_odds = row.get(keys["odds"]) or ""
-            odds_value = parse_american_odds(raw_odds)
-            odds = html.escape(format_odds(raw_odds))
-            champ_raw = row.get(keys["champion"]) or ""
-            champ = is_current_champion(champ_raw)
-            raw_result = ""
-            if keys.get("result"):
-                raw_result = (row.get(keys["result"]) or "").strip().upper()
-            result_value = raw_result if raw_result in {"W", "L"} else ""
-
-            champ_class = " wrestler champion" if champ else " wrestler"
-            if result_value == "L":
-                champ_class += " result-lost"
-            belt_icon = ""
-            if champ:
-                belt_path = html.escape(belt_image_for_match(match_name))
-                belt_icon = (
-                    f'<img class="belt-icon" src="{belt_path}" '
-                    f'alt="{html.escape(match_name)} belt">'
-                )
-            result_indicator = ""
-            if result_value == "W":
-                result_indicator = '<span class="result-pill winner">Winner</span>'
-            elif result_value == "L":
-                result_indicator = '<span class="result-pill lost">Lost</span>'
-            odds_data = html.escape(str(odds_value) if odds_value is not None else "")
-            result_data = html.escape(result_value)
-            wager_disabled = " disabled" if odds_value is None else ""
-            wager_placeholder = "TBD" if odds_value is None else "0"
-
-            wrestler_items.append(
-                f"""
-                <div class="{champ_class}" data-match="{safe_match_name}" data-odds="{odds_data}" data-result="{result_data}">
-                    <div class="wrestler-main">
-                        <span class="name">{wrestler_name}{belt_icon}{result_indicator}</span>
-                    </div>
-                    <div class="odds">Odds: {odds}</div>
-                    <div class="wager-row">
-                        <label class="wager-label">Wager (pts)</label>
-                        <input class="wager-input" type="number" min="0" step="1" value="0" placeholder="{wager_placeholder}"{wager_disabled}>
-                    </div>
-                </div>
-                """
-            )
-        match_sections.append(
-            f"""
-            <section class="match-card">
-                <button class="match-toggle" type="button" aria-expanded="true">
-                    <h2>{safe_match_name}</h2>
-                    <span class="toggle-icon" aria-hidden="true">▾</span>
-                </button>
-                <div class="match-body">
-                    {"".join(wrestler_items)}
-                </div>
-            </section>
-            """
-        )
 
-    template = load_template(TEMPLATE_FILE)
-    return template.safe_substitute(
-        page_title=f"{event_name} ({event_id})",
-        event_header=event_header,
-        event_id_plain=event_id,
-        event_name_plain=event_name,
-        event_name=event_name,
-        start_time=start_time,
-        event_date=event_date,
-        country=country,
-        location=location,
-        venue=venue,
-        last_updated=last_updated,
-        match_sections="".join(match_sections),
-    )
+def parse_whole_number(value: str) -> int:
+    """
+    Convert leaderboard text like '12', '-3' or '4.5' to a whole number.
+    Blank or invalid values count as 0; decimals are truncated.
+    """
+    cleaned = (value or "").strip()
+    if not cleaned:
+        return 0
+    digits = cleaned[1:] if cleaned[:1] in ("+", "-") else cleaned
+    # Plain integers skip float(); past 15 digits float() rounds, so those
+    # keep going through it to match the float-based parse below.
+    if digits.isdecimal() and len(digits) <= 15:
+        return int(cleaned)
+    try:
+        return int(float(cleaned))
+    except ValueError:
+        return 0
 
 
 def load_leaderboard_rows(event_id: str) -> list[dict]:
@@ -332,40 +418,38 @@ def load_leaderboard_rows(event_id: str) -> list[dict]:
     Expected path: data/<EventID>_leaderboard.csv
     Columns: Player, Score, PendingWager, MaxPossiblePoints, Wins, Losses
     """
-    leaderboard_path = Path("data") / f"{event_id}_leaderboard.csv"
-    if not leaderboard_path.exists():
+    leaderboard_path = find_indexed_file(DATA_DIR, "*_leaderboard.csv", f"{event_id}_leaderboard.csv")
+    if not leaderboard_path:
         return []
-    with leaderboard_path.open("r", newline="", encoding="utf-8-sig") as f:
-        rows = list(csv.DictReader(f))
+    header, rows = load_rows(leaderboard_path)
     if not rows:
         return []
 
+    # Resolve column positions once; absent columns point at a blank cell
+    # appended to each row.
+    column_by_name = {column: index for index, column in enumerate(header)}
+    blank_col = len(header)
+    player_col = column_by_name.get("Player", blank_col)
+    score_col = column_by_name.get("Score", blank_col)
+    net_col = column_by_name.get("Net", blank_col)
+    pending_wager_col = column_by_name.get("PendingWager", blank_col)
+    max_possible_points_col = column_by_name.get("MaxPossiblePoints", blank_col)
+    wins_col = column_by_name.get("Wins", blank_col)
+    losses_col = column_by_name.get("Losses", blank_col)
+
     valid_rows = []
     for row in rows:
-        player = (row.get("Player") or "").strip()
+        # Cells past the header have no column name, so they are dropped.
+        del row[blank_col:]
+        row.append("")
+        player = row[player_col].strip()
         if not player:
             continue
-        try:
-            score = int(float((row.get("Score") or row.get("Net") or "0").strip() or "0"))
-        except ValueError:
-            score = 0
-        score = max(0, score)
-        try:
-            pending_wager = int(float((row.get("PendingWager") or "0").strip() or "0"))
-        except ValueError:
-            pending_wager = 0
-        try:
-            max_possible_points = int(float((row.get("MaxPossiblePoints") or "0").strip() or "0"))
-        except ValueError:
-            max_possible_points = 0
-        try:
-            wins = int(float((row.get("Wins") or "0").strip() or "0"))
-        except ValueError:
-            wins = 0
-        try:
-            losses = int(float((row.get("Losses") or "0").strip() or "0"))
-        except ValueError:
-            losses = 0
+        score = max(0, parse_whole_number(row[score_col] or row[net_col]))
+        pending_wager = parse_whole_number(row[pending_wager_col])
+        max_possible_points = parse_whole_number(row[max_possible_points_col])
+        wins = parse_whole_number(row[wins_col])
+        losses = parse_whole_number(row[losses_col])
         valid_rows.append(
             {
                 "Player": player,
@@ -376,115 +460,162 @@ def load_leaderboard_rows(event_id: str) -> list[dict]:
                 "Losses": losses,
             }
         )
-    valid_rows.sort(key=lambda item: item["Score"], reverse=True)
+    valid_rows.sort(key=itemgetter("Score"), reverse=True)
     return valid_rows
 
 
-def format_whole(value: int) -> str:
-    """Format integer-like values as whole numbers."""
-    return str(int(value))
-
+def build_event_pages(
+    event_rows: list[list[str]],
+    columns: dict[str, int],
+    leaderboard_rows: list[dict],
+    page_template: SplitTemplate,
+    last_updated: str,
+) -> tuple[str, str, list[str]]:
+    """
+    Build the picks page and the live tracker page for one event.
+    Both pages show the same wrestler cards, so rows are read, grouped and
+    escaped once and the card markup for each page is emitted side by side.
+    page_template is template.html as split once by main; last_updated is
+    the run's generation timestamp, shared with the index.
+    Returns (event_html, live_html, match_names), with match names in card order.
+    """
+    # Built once for this column layout, the getter pulls every per-card field
+    # from a row in a single C-level call.
+    read_card_fields = itemgetter(columns["match"], columns["wrestler"], columns["odds"], columns["champion"])
+    result_col = columns.get("result")
 
-def build_live_html(event_rows: list[dict], keys: dict[str, str], leaderboard_rows: list[dict]) -> str:
-    """Build live tracker page HTML for one event."""
     first = event_rows[0]
-    raw_event_name = (first.get(keys["event"]) or "Unknown Event").strip()
-    raw_event_id = (first.get(keys["event_id"]) or "").strip()
-    event_name = html.escape(raw_event_name)
-    event_id = html.escape(raw_event_id)
-    event_date = html.escape(format_event_date(first.get(keys["date"]) or ""))
-    start_time = html.escape(format_start_time(first.get(keys["start_time"]) or ""))
-    country = html.escape((first.get(keys["country"]) or "").strip())
-    location = html.escape((first.get(keys["location"]) or "").strip())
-    venue = html.escape((first.get(keys["venue"]) or "").strip())
+    raw_event_name = (first[columns["event"]] or "Unknown Event").strip()
+    raw_event_id = first[columns["event_id"]].strip()
+    event_name = escape_html(raw_event_name)
+    event_id = escape_html(raw_event_id)
+    event_date = escape_html(format_event_date(first[columns["date"]]))
+    start_time = escape_html(format_start_time(first[columns["start_time"]]))
+    country = escape_html(first[columns["country"]].strip())
+    location = escape_html(first[columns["location"]].strip())
+    venue = escape_html(first[columns["venue"]].strip())
     logo_path = find_logo_path(raw_event_id)
-    last_updated = datetime.now(timezone.utc).strftime("%B %d, %Y %H:%M UTC")
 
     if logo_path:
         event_header = (
-            f'<img class="event-logo" src="{html.escape(logo_path)}" '
-            f'alt="{html.escape(raw_event_name)} logo">'
+            f'<img class="event-logo" src="{escape_html(logo_path)}" '
+            f'alt="{escape_html(raw_event_name)} logo">'
         )
     else:
         event_header = f"<h1>{event_name}</h1>"
 
-    matches = OrderedDict()
+    # Render wrestler cards in a single pass over the rows, bucketed by match
+    # in the order each match first appears.
+    matches: dict[str, tuple[str, list[str], list[str]]] = {}
+    # The belt icon only depends on the match, so it is built the first time a
+    # champion appears in that match and skipped entirely for non-title matches.
+    belt_icons: dict[str, str] = {}
+    decided_matches: set[str] = set()
     for row in event_rows:
-        match_name = (row.get(keys["match"]) or "Unknown Match").strip()
-        matches.setdefault(match_name, []).append(row)
+        raw_match, raw_wrestler, raw_odds, champ_raw = read_card_fields(row)
+        match_name = (raw_match or "Unknown Match").strip()
+        match_entry = matches.get(match_name)
+        if match_entry is None:
+            match_entry = matches[match_name] = (escape_html(match_name), [], [])
+        safe_match_name, pick_cards, live_cards = match_entry
+
+        wrestler_name = escape_html((raw_wrestler or "Unknown Wrestler").strip())
+        odds_value = parse_american_odds(raw_odds)
+        # Odds text is only ever "TBD" or a signed integer, so it needs no escaping.
+        odds = format_odds(odds_value)
+        champ = is_current_champion(champ_raw)
+        raw_result = ""
+        if result_col is not None:
+            raw_result = row[result_col].strip().upper()
+        result_value = raw_result if raw_result in {"W", "L"} else ""
+
+        champ_class = " wrestler champion" if champ else " wrestler"
+        if result_value == "L":
+            champ_class += " result-lost"
+        belt_icon = ""
+        if champ:
+            belt_icon = belt_icons.get(match_name)
+            if belt_icon is None:
+                belt_icon = belt_icons[match_name] = (
+                    f'<img class="belt-icon" src="{escape_html(belt_image_for_match(match_name))}" '
+                    f'alt="{safe_match_name} belt">'
+                )
+        result_indicator = ""
+        if result_value == "W":
+            result_indicator = '<span class="result-pill winner">Winner</span>'
+            decided_matches.add(match_name)
+        elif result_value == "L":
+            result_indicator = '<span class="result-pill lost">Lost</span>'
+        odds_data = "" if odds_value is None else str(odds_value)
+        wager_disabled = " disabled" if odds_value is None else ""
+        wager_placeholder = "TBD" if odds_value is None else "0"
+
+        pick_cards.append(PICK_CARD_HTML % (
+            champ_class, safe_match_name, odds_data, result_value,
+            wrestler_name, belt_icon, result_indicator, odds,
+            wager_placeholder, wager_disabled,
+        ))
+        live_cards.append(LIVE_CARD_HTML % (
+            champ_class, wrestler_name, belt_icon, result_indicator, odds,
+        ))
 
+    # Collect every fragment of each page's match sections in one list and join once.
+    pick_parts: list[str] = []
+    live_parts: list[str] = []
     total_matches = len(matches)
     completed_matches = 0
-    match_sections = []
     any_pending = False
+    for match_name, (safe_match_name, pick_cards, live_cards) in matches.items():
+        pick_parts.extend((
+            '\n<section class="match-card">\n'
+            '  <button class="match-toggle" type="button" aria-expanded="true">\n'
+            '    <h2>', safe_match_name, '</h2>\n'
+            '    <span class="toggle-icon" aria-hidden="true">▾</span>\n'
+            '  </button>\n'
+            '  <div class="match-body">\n',
+        ))
+        pick_parts.extend(pick_cards)
+        pick_parts.append('  </div>\n</section>\n')
 
-    for match_name, rows in matches.items():
-        winner_count = 0
-        wrestler_items = []
-        for row in rows:
-            wrestler_name_raw = (row.get(keys["wrestler"]) or "Unknown Wrestler").strip()
-            wrestler_name = html.escape(wrestler_name_raw)
-            raw_odds = row.get(keys["odds"]) or ""
-            odds = html.escape(format_odds(raw_odds))
-            champ_raw = row.get(keys["champion"]) or ""
-            champ = is_current_champion(champ_raw)
-            result_raw = (row.get(keys.get("result", "")) or "").strip().upper() if keys.get("result") else ""
-            result_value = result_raw if result_raw in {"W", "L"} else ""
-
-            champ_class = " wrestler champion" if champ else " wrestler"
-            if result_value == "L":
-                champ_class += " result-lost"
-
-            belt_icon = ""
-            if champ:
-                belt_path = html.escape(belt_image_for_match(match_name))
-                belt_icon = (
-                    f'<img class="belt-icon" src="{belt_path}" '
-                    f'alt="{html.escape(match_name)} belt">'
-                )
-
-            result_indicator = ""
-            if result_value == "W":
-                result_indicator = '<span class="result-pill winner">Winner</span>'
-                winner_count += 1
-            elif result_value == "L":
-                result_indicator = '<span class="result-pill lost">Lost</span>'
-
-            wrestler_items.append(
-                f"""
-                <div class="{champ_class}">
-                    <div class="wrestler-main">
-                        <span class="name">{wrestler_name}{belt_icon}{result_indicator}</span>
-                    </div>
-                    <div class="odds">Odds: {odds}</div>
-                </div>
-                """
-            )
-
-        match_status = "Final" if winner_count >= 1 else "Pending"
-        match_status_class = "final" if winner_count >= 1 else "pending"
-        if winner_count >= 1:
+        if match_name in decided_matches:
+            match_status = "Final"
+            match_status_class = "final"
             completed_matches += 1
         else:
+            match_status = "Pending"
+            match_status_class = "pending"
             any_pending = True
-
-        safe_match_name = html.escape(match_name)
-        match_sections.append(
-            f"""
-            <section class="match-card">
-                <button class="match-toggle" type="button" aria-expanded="true">
-                    <div class="match-toggle-meta">
-                        <h2>{safe_match_name}</h2>
-                        <span class="match-status {match_status_class}">Status: {match_status}</span>
-                    </div>
-                    <span class="toggle-icon" aria-hidden="true">▾</span>
-                </button>
-                <div class="match-body">
-                    {"".join(wrestler_items)}
-                </div>
-            </section>
-            """
-        )
+        live_parts.extend((
+            '\n<section class="match-card">\n'
+            '  <button class="match-toggle" type="button" aria-expanded="true">\n'
+            '    <div class="match-toggle-meta">\n'
+            '      <h2>', safe_match_name, '</h2>\n'
+            '      <span class="match-status ', match_status_class, '">Status: ', match_status, '</span>\n'
+            '    </div>\n'
+            '    <span class="toggle-icon" aria-hidden="true">▾</span>\n'
+            '  </button>\n'
+            '  <div class="match-body">\n',
+        ))
+        live_parts.extend(live_cards)
+        live_parts.append('  </div>\n</section>\n')
+
+    event_html = render_template(
+        page_template,
+        {
+            "page_title": f"{event_name} ({event_id})",
+            "event_header": event_header,
+            "event_id_plain": event_id,
+            "event_name_plain": event_name,
+            "event_name": event_name,
+            "start_time": start_time,
+            "event_date": event_date,
+            "country": country,
+            "location": location,
+            "venue": venue,
+            "last_updated": last_updated,
+            "match_sections": "".join(pick_parts),
+        },
+    )
 
     if completed_matches == 0:
         live_status = "Pending"
@@ -497,26 +628,18 @@ def build_live_html(event_rows: list[dict], keys: dict[str, str], leaderboard_ro
         top_score = max((row["Score"] for row in leaderboard_rows), default=0)
         leaderboard_body = []
         for row in leaderboard_rows:
-            player = html.escape(row["Player"])
-            score = html.escape(format_whole(max(0, row["Score"])))
-            wins = html.escape(format_whole(row["Wins"]))
-            losses = html.escape(format_whole(row["Losses"]))
-            pending_wager = html.escape(format_whole(row["PendingWager"]))
-            max_possible = html.escape(format_whole(row["MaxPossiblePoints"]))
-            max_output = html.escape(format_whole(max(0, row["Score"]) + row["MaxPossiblePoints"]))
-            leader_class = " leader-row" if row["Score"] == top_score else ""
-            leaderboard_body.append(
-                f"""
-                <tr class="{leader_class.strip()}">
-                  <td>{player}</td>
-                  <td class="score-cell">{score}</td>
-                  <td class="stat-cell">{wins}-{losses}</td>
-                  <td class="num-cell">{pending_wager}</td>
-                  <td class="num-cell">{max_possible}</td>
-                  <td class="num-cell">{max_output}</td>
-                </tr>
-                """
-            )
+            score = max(0, row["Score"])
+            # Only the player name needs escaping; the numbers are ints.
+            leaderboard_body.append(LEADERBOARD_ROW_HTML % (
+                "leader-row" if row["Score"] == top_score else "",
+                escape_html(row["Player"]),
+                score,
+                row["Wins"],
+                row["Losses"],
+                row["PendingWager"],
+                row["MaxPossiblePoints"],
+                score + row["MaxPossiblePoints"],
+            ))
         leaderboard_html = f"""
         <section class="summary-panel leaderboard-panel">
           <h3 class="summary-title">Leaderboard</h3>
@@ -547,7 +670,7 @@ def build_live_html(event_rows: list[dict], keys: dict[str, str], leaderboard_ro
         </section>
         """
 
-    return f"""<!doctype html>
+    live_html = f"""<!doctype html>
 <html lang="en">
 <head>
   <meta charset="UTF-8">
@@ -566,7 +689,7 @@ def build_live_html(event_rows: list[dict], keys: dict[str, str], leaderboard_ro
         <div><strong>Location:</strong> {location}</div>
         <div><strong>Venue:</strong> {venue}</div>
       </div>
-      <div class="live-status-line"><strong>Status:</strong> {html.escape(live_status)} | <strong>Matches completed:</strong> {completed_matches} / {total_matches}</div>
+      <div class="live-status-line"><strong>Status:</strong> {escape_html(live_status)} | <strong>Matches completed:</strong> {completed_matches} / {total_matches}</div>
     </header>
 
     <nav class="page-nav" aria-label="Page navigation">
@@ -582,11 +705,11 @@ def build_live_html(event_rows: list[dict], keys: dict[str, str], leaderboard_ro
     </section>
 
     <section class="matches">
-      {"".join(match_sections)}
+      {"".join(live_parts)}
     </section>
 
     <footer class="site-footer">
-      Last updated: {html.escape(last_updated)}
+      Last updated: {escape_html(last_updated)}
     </footer>
   </main>
   <script>
@@ -618,6 +741,13 @@ def build_live_html(event_rows: list[dict], keys: dict[str, str], leaderboard_ro
 </body>
 </html>
 """
+    return event_html, live_html, list(matches)
+
+
+def write_html_file(output_path: Path, html_text: str) -> None:
+    """Write a generated page as UTF-8 in a single buffered write."""
+    with output_path.open("wb", buffering=OUTPUT_BUFFER_SIZE) as f:
+        f.write(html_text.encode("utf-8"))
 
 
 def main() -> None:
@@ -637,28 +767,28 @@ def main() -> None:
     if not TEMPLATE_FILE.exists():
         print(f"Error: Could not find '{TEMPLATE_FILE}'.")
         return
+    # Read and split the page template once for every event in the run.
+    page_template = split_template(load_template(TEMPLATE_FILE))
 
-    rows = load_rows(csv_path)
+    header, rows = load_rows(csv_path)
     if not rows:
         print("Error: CSV file is empty.")
         return
 
-    sample_row = rows[0]
-
     # Support both the user's listed headers and the current CSV headers.
     keys = {
-        "event_id": pick_first_key(sample_row, ["EventID"]),
-        "event": pick_first_key(sample_row, ["Event"]),
-        "date": pick_first_key(sample_row, ["Date"]),
-        "start_time": pick_first_key(sample_row, ["StartTime", "Start Time"]),
-        "country": pick_first_key(sample_row, ["Country"]),
-        "location": pick_first_key(sample_row, ["Location"]),
-        "venue": pick_first_key(sample_row, ["Venue"]),
-        "match": pick_first_key(sample_row, ["Match"]),
-        "wrestler": pick_first_key(sample_row, ["Wrestler"]),
-        "champion": pick_first_key(sample_row, ["CurrentChamp", "Current Champ (Y/N)"]),
-        "odds": pick_first_key(sample_row, ["Odds"]),
-        "result": pick_first_key(sample_row, ["Result"]),
+        "event_id": pick_first_key(header, ["EventID"]),
+        "event": pick_first_key(header, ["Event"]),
+        "date": pick_first_key(header, ["Date"]),
+        "start_time": pick_first_key(header, ["StartTime", "Start Time"]),
+        "country": pick_first_key(header, ["Country"]),
+        "location": pick_first_key(header, ["Location"]),
+        "venue": pick_first_key(header, ["Venue"]),
+        "match": pick_first_key(header, ["Match"]),
+        "wrestler": pick_first_key(header, ["Wrestler"]),
+        "champion": pick_first_key(header, ["CurrentChamp", "Current Champ (Y/N)"]),
+        "odds": pick_first_key(header, ["Odds"]),
+        "result": pick_first_key(header, ["Result"]),
     }
 
     required_keys = ["event_id", "event", "date", "start_time", "country", "location", "venue", "match", "wrestler", "champion", "odds"]
@@ -668,49 +798,64 @@ def main() -> None:
         print("Please check the header row in your CSV.")
         return
 
-    available_event_ids = get_available_event_ids(rows, keys["event_id"])
-    if not available_event_ids:
+    # Map each logical field to its column position; when a header name repeats,
+    # the last column wins, as it did with csv.DictReader.
+    column_by_name = {column: index for index, column in enumerate(header)}
+    columns = {name: column_by_name[column] for name, column in keys.items() if column}
+
+    rows_by_event_id = collect_event_rows(rows, columns["event_id"])
+    if not rows_by_event_id:
         print("Error: No EventID values found.")
         return
 
-    print("Available EventIDs:", ", ".join(available_event_ids))
+    print("Available EventIDs:", ", ".join(rows_by_event_id))
+
+    # One timestamp for the whole run, shared by every event page and the index.
+    last_updated = datetime.now(timezone.utc).strftime("%B %d, %Y %H:%M UTC")
 
     event_summaries = []
-    for event_id in available_event_ids:
-        event_rows = [
-            row for row in rows
-            if normalize(row.get(keys["event_id"]) or "") == normalize(event_id)
-        ]
-        if not event_rows:
-            continue
+    pending_writes = []
+    latest_write_by_path = {}
+    # Page files are written on worker threads so disk I/O overlaps with
+    # building the next event's pages.
+    with ThreadPoolExecutor(max_workers=WRITE_WORKERS) as pool:
+        for event_id, event_rows in rows_by_event_id.items():
+            output_file = event_output_file(event_id)
+            live_output_file = Path(f"live_{sanitize_event_id(event_id)}.html")
+            leaderboard_rows = load_leaderboard_rows(event_id)
+            html_text, live_html, detected_matches = build_event_pages(
+                event_rows, columns, leaderboard_rows, page_template, last_updated
+            )
+            print(f"Detected Match names for {event_id}:")
+            for match_name in detected_matches:
+                print(f" - {match_name}")
+
+            for path, text in ((output_file, html_text), (live_output_file, live_html)):
+                # EventIDs can sanitize to the same file name; finish the earlier
+                # write first so the last event still wins, as with serial writes.
+                previous_write = latest_write_by_path.get(path)
+                if previous_write:
+                    previous_write.result()
+                pending_write = pool.submit(write_html_file, path, text)
+                latest_write_by_path[path] = pending_write
+                pending_writes.append((path, pending_write))
+
+            first = event_rows[0]
+            event_summaries.append(
+                {
+                    "event_id": first[columns["event_id"]].strip(),
+                    "event_name": (first[columns["event"]] or "Unknown Event").strip(),
+                    "date": first[columns["date"]].strip(),
+                    "location": (first[columns["location"]] or "Unknown Location").strip() or "Unknown Location",
+                    "file_name": output_file.name,
+                }
+            )
 
-        detected_matches = list(OrderedDict.fromkeys(
-            (row.get(keys["match"]) or "Unknown Match").strip() for row in event_rows
-        ))
-        print(f"Detected Match names for {event_id}:")
-        for match_name in detected_matches:
-            print(f" - {match_name}")
-
-        output_file = event_output_file(event_id)
-        html_text = build_event_html(event_rows, keys)
-        output_file.write_text(html_text, encoding="utf-8")
-        print(f"Created '{output_file.name}'.")
-        live_output_file = Path(f"live_{sanitize_event_id(event_id)}.html")
-        leaderboard_rows = load_leaderboard_rows(event_id)
-        live_html = build_live_html(event_rows, keys, leaderboard_rows)
-        live_output_file.write_text(live_html, encoding="utf-8")
-        print(f"Created '{live_output_file.name}'.")
-
-        first = event_rows[0]
-        event_summaries.append(
-            {
-                "event_id": (first.get(keys["event_id"]) or "").strip(),
-                "event_name": (first.get(keys["event"]) or "Unknown Event").strip(),
-                "date": (first.get(keys["date"]) or "").strip(),
-                "location": (first.get(keys["location"]) or "Unknown Location").strip() or "Unknown Location",
-                "file_name": output_file.name,
-            }
-        )
+        # Surface any write error before the index links to the pages, and
+        # only report a page once it is on disk.
+        for path, pending_write in pending_writes:
+            pending_write.result()
+            print(f"Created '{path.name}'.")
 
     event_summaries.sort(
         key=lambda item: parse_event_date_for_sort(item["date"]),
@@ -719,12 +864,12 @@ def main() -> None:
 
     index_items = []
     for item in event_summaries:
-        event_name = html.escape(item["event_name"])
-        event_id = html.escape(item["event_id"])
-        date_text = html.escape(format_event_date(item["date"]))
-        location = html.escape(item["location"])
-        href = html.escape(item["file_name"])
-        live_href = html.escape(f"live_{sanitize_event_id(item['event_id'])}.html")
+        event_name = escape_html(item["event_name"])
+        event_id = escape_html(item["event_id"])
+        date_text = escape_html(format_event_date(item["date"]))
+        location = escape_html(item["location"])
+        href = escape_html(item["file_name"])
+        live_href = escape_html(f"live_{sanitize_event_id(item['event_id'])}.html")
         index_items.append(
             f"""
             <section class="match-card">
@@ -739,7 +884,6 @@ def main() -> None:
             """
         )
 
-    index_updated = datetime.now(timezone.utc).strftime("%B %d, %Y %H:%M UTC")
     index_html = f"""<!doctype html>
 <html lang="en">
 <head>
@@ -752,19 +896,19 @@ def main() -> None:
   <main class="container">
     <header class="event-header">
       <h1>Event Pages</h1>
-      <div class="event-meta"><div>Generated from {html.escape(csv_path.name)}</div></div>
+      <div class="event-meta"><div>Generated from {escape_html(csv_path.name)}</div></div>
     </header>
     <section class="matches">
       {"".join(index_items)}
     </section>
     <footer class="site-footer">
-      Last updated: {html.escape(index_updated)}
+      Last updated: {escape_html(last_updated)}
     </footer>
   </main>
 </body>
 </html>
 """
-    INDEX_FILE.write_text(index_html, encoding="utf-8")
+    write_html_file(INDEX_FILE, index_html)
     print(f"Created '{INDEX_FILE.name}'.")
     if LEGACY_EVENT_FILE.exists():
         print(